@@ -3,11 +3,84 @@
 NEM Data Loader - Easy access to organized RRP data
 """
 
+import functools
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 from pathlib import Path
 
 
-def load_rrp_data(region, start_date=None, end_date=None):
+# Hive-partitioned layout written by scripts/partition_rrp_data.py
+PARTITIONED_RRP_PATH = Path('data/organized/rrp')
+
+
+def _rrp_dataset(region, start_date=None, end_date=None):
+    """Return the dataset for a region and any partition filter for the range."""
+    region_path = PARTITIONED_RRP_PATH / f'region={region}'
+    
+    if region_path.exists():
+        # File-level pruning: only the year=YYYY directories in range are opened
+        year = ds.field('year')
+        year_filter = None
+        if start_date:
+            year_filter = year >= pd.Timestamp(start_date).year
+        if end_date:
+            end_year_filter = year <= pd.Timestamp(end_date).year
+            year_filter = end_year_filter if year_filter is None else year_filter & end_year_filter
+        return ds.dataset(str(region_path), format='parquet', partitioning='hive'), year_filter
+    
+    data_file = Path(f'data/organized/{region}_rrp_2020_2025.parquet')
+    
+    if not data_file.exists():
+        raise FileNotFoundError(f"Data file not found: {data_file}")
+    
+    return ds.dataset(str(data_file), format='parquet'), None
+
+
+def _rrp_mtime_ns(region):
+    """Modification time of a region's RRP data (newest part file if partitioned)."""
+    region_path = PARTITIONED_RRP_PATH / f'region={region}'
+    if region_path.exists():
+        return max((part.stat().st_mtime_ns for part in region_path.rglob('*.parquet')), default=0)
+    
+    data_file = Path(f'data/organized/{region}_rrp_2020_2025.parquet')
+    return data_file.stat().st_mtime_ns if data_file.exists() else 0
+
+
+@functools.lru_cache(maxsize=8)
+def _read_rrp_table(region, mtime_ns, start_date=None, end_date=None):
+    """
+    Read and cache the filtered RRP parquet as an Arrow table.
+    
+    mtime_ns is only part of the cache key, so data rewritten by
+    scripts/partition_rrp_data.py is read again instead of being served stale.
+    """
+    dataset, row_filter = _rrp_dataset(region, start_date, end_date)
+    
+    # Push the date range down to the dataset scanner. The files are sorted
+    # by SETTLEMENTDATE, so row-group min/max statistics are tight and any
+    # row group outside [start_date, end_date] is skipped without decoding.
+    settlement = ds.field('SETTLEMENTDATE')
+    if start_date:
+        start_filter = settlement >= pa.scalar(pd.Timestamp(start_date), type=pa.timestamp('ns'))
+        row_filter = start_filter if row_filter is None else row_filter & start_filter
+    if end_date:
+        end_filter = settlement <= pa.scalar(pd.Timestamp(end_date), type=pa.timestamp('ns'))
+        row_filter = end_filter if row_filter is None else row_filter & end_filter
+    
+    table = dataset.to_table(
+        columns=['SETTLEMENTDATE', 'price_aud_per_mwh'],
+        filter=row_filter,
+    )
+    
+    # RRP fits in float32 without meaningful loss; halves cached/loaded bytes
+    price_idx = table.schema.get_field_index('price_aud_per_mwh')
+    return table.set_column(
+        price_idx, 'price_aud_per_mwh', table.column(price_idx).cast(pa.float32())
+    )
+
+
+def load_rrp_data(region, start_date=None, end_date=None, dtype_backend=None):
     """
     Load RRP data for a specific region and optional date range.
     
@@ -15,29 +88,33 @@ def load_rrp_data(region, start_date=None, end_date=None):
         region (str): Region code (NSW1, VIC1, QLD1, SA1)
         start_date (str, optional): Start date in YYYY-MM-DD format
         end_date (str, optional): End date in YYYY-MM-DD format
+        dtype_backend (str, optional): 'pyarrow' for ArrowDtype columns that
+            share the cached Arrow buffers; default is NumPy-backed columns
     
     Returns:
-        pd.DataFrame: RRP data with datetime index
+        pd.DataFrame: RRP price column (price_aud_per_mwh) with datetime index
     """
-    data_file = Path(f'data/organized/{region}_rrp_2020_2025.parquet')
-    
-    if not data_file.exists():
-        raise FileNotFoundError(f"Data file not found: {data_file}")
-    
-    df = pd.read_parquet(data_file)
-    
-    if start_date or end_date:
-        if start_date:
-            df = df[df.index >= start_date]
-        if end_date:
-            df = df[df.index <= end_date]
-    
-    return df
+    # The Arrow table is cached per (region, start_date, end_date), so repeat
+    # calls only pay for the Arrow -> pandas conversion, not a parquet decode
+    table = _read_rrp_table(region, _rrp_mtime_ns(region), start_date, end_date)
+    if dtype_backend == 'pyarrow':
+        # Keep the timestamp index as a NumPy DatetimeIndex so date accessors work
+        return table.to_pandas(
+            types_mapper=lambda t: None if pa.types.is_timestamp(t) else pd.ArrowDtype(t)
+        )
+    # Converted into a new pandas block (not zero-copy), so the frame is
+    # writable and edits never reach the cached table
+    return table.to_pandas()
 
 
 def get_available_regions():
     """Get list of available regions."""
-    return ['NSW1', 'VIC1', 'QLD1', 'SA1']
+    if PARTITIONED_RRP_PATH.exists():
+        return sorted(p.name.split('=', 1)[1] for p in PARTITIONED_RRP_PATH.glob('region=*'))
+    return sorted(
+        f.stem.replace('_rrp_2020_2025', '')
+        for f in Path('data/organized').glob('*_rrp_2020_2025.parquet')
+    )
 
 
 def get_data_info():
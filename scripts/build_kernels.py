@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Compile the battery simulation kernels ahead of time with numba.pycc.
+
+Writes battery_sim/_dispatch_aot.*.so next to the package sources. The
+simulator imports it in place of the JIT-compiled kernel, so one-shot runs
+skip numba's import and compile cost entirely, until the kernel source
+changes and the build no longer matches it.
+"""
+
+import sys
+
+from battery_sim._kernels import build
+
+
+def main():
+    """Build the ahead-of-time kernel module."""
+    build()
+    print("Built battery_sim._dispatch_aot")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,16 +3,23 @@
 Streamlit web interface for hybrid PV+BESS simulation.
 """
 
-import sys
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, time
-from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path('src').resolve()))
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy reductions are used instead
+    njit = None
 
 from battery_sim.config import (
     BatteryConfig,
@@ -25,18 +32,110 @@ from battery_sim.config import (
     VolumeCharge,
     DemandCharge,
 )
-from battery_sim.sim_hybrid import run_simulation_hybrid
+from battery_sim.worker import run_simulation_to_ipc, read_intervals_ipc
+from battery_sim._kernels import year_summary as _year_summary_kernel
+
+
+@st.cache_resource
+def _simulation_pool() -> ProcessPoolExecutor:
+    """Persistent worker process; keeps imports and JIT caches warm across runs."""
+    # Spawn rather than fork: forking the Streamlit server would copy its
+    # threads and locks into the worker
+    return ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def run_simulation_cached(battery, sim, market, windows, tariffs, solar):
+    """Run the hybrid simulation, memoized on the configuration dataclasses."""
+    future = _simulation_pool().submit(
+        run_simulation_to_ipc, battery, sim, market, windows, tariffs, solar
+    )
+    try:
+        payload, summary = future.result()
+    except BrokenProcessPool:
+        # Start a fresh worker on the next run rather than keep a dead pool
+        _simulation_pool.clear()
+        raise
+
+    return {"intervals": read_intervals_ipc(payload), "summary": summary}
+
+
+def _masked_mean(values: np.ndarray, mask: np.ndarray) -> float:
+    """Mean of ``values`` where ``mask`` is set, or 0.0 if the mask is empty."""
+    count = np.count_nonzero(mask)
+    return float(values.sum(where=mask, dtype=np.float64) / count) if count else 0.0
+
+
+if njit is not None:
+    _year_summary_kernel = njit(cache=True, fastmath=True, boundscheck=False)(_year_summary_kernel)
+
+
+def year_bounds(intervals_df: pd.DataFrame) -> dict:
+    """Map each calendar year to the (start, stop) row positions of its intervals."""
+    # Intervals are in time order, so each year is one contiguous run of rows
+    years = intervals_df.index.year.to_numpy()
+    return {
+        int(year): tuple(int(pos) for pos in np.searchsorted(years, [year, year + 1]))
+        for year in np.unique(years)
+    }
 
 
 def calculate_year_summary(intervals_df: pd.DataFrame, year: int) -> dict:
     """Calculate summary metrics for a specific year."""
-    # Calculate summary metrics
-    total_charge = intervals_df["energy_charge_mwh"].sum()
-    total_discharge = intervals_df["energy_discharge_mwh"].sum()
-    total_solar_export = intervals_df["energy_solar_export_mwh"].sum()
-    total_revenue = intervals_df["energy_revenue_aud"].sum()
-    total_cost = intervals_df["energy_cost_aud"].sum()
-    total_network_cost = intervals_df["network_cost_aud"].sum()
+    price = intervals_df["price"].to_numpy()
+    
+    if njit is not None:
+        # One compiled pass computes every total and masked price sum
+        (
+            total_charge, total_discharge, total_solar_export,
+            total_revenue, total_cost, total_network_cost,
+            price_sum, import_sum, n_import, export_sum, n_export,
+            solar_export_sum, n_solar_export,
+        ) = _year_summary_kernel(
+            price,
+            intervals_df["p_charge_mw"].to_numpy(),
+            intervals_df["p_discharge_mw"].to_numpy(),
+            intervals_df["p_solar_export_mw"].to_numpy(),
+            intervals_df["energy_charge_mwh"].to_numpy(),
+            intervals_df["energy_discharge_mwh"].to_numpy(),
+            intervals_df["energy_solar_export_mwh"].to_numpy(),
+            intervals_df["energy_revenue_aud"].to_numpy(),
+            intervals_df["energy_cost_aud"].to_numpy(),
+            intervals_df["network_cost_aud"].to_numpy(),
+        )
+        avg_import_price = import_sum / n_import if n_import else 0.0
+        avg_export_price = export_sum / n_export if n_export else 0.0
+        avg_solar_export_price = solar_export_sum / n_solar_export if n_solar_export else 0.0
+        avg_price = price_sum / price.size if price.size else np.nan
+    else:
+        # Calculate summary metrics in one reduction over the energy/cost columns
+        (
+            total_charge,
+            total_discharge,
+            total_solar_export,
+            total_revenue,
+            total_cost,
+            total_network_cost,
+        ) = intervals_df[[
+            "energy_charge_mwh",
+            "energy_discharge_mwh",
+            "energy_solar_export_mwh",
+            "energy_revenue_aud",
+            "energy_cost_aud",
+            "network_cost_aud",
+        ]].to_numpy().sum(axis=0, dtype=np.float64)
+        
+        # Price metrics - masks are built once and reduced without copying rows
+        charging = intervals_df["p_charge_mw"].to_numpy() > 0
+        discharging = intervals_df["p_discharge_mw"].to_numpy() > 0
+        exporting = intervals_df["p_solar_export_mw"].to_numpy() > 0
+        
+        avg_import_price = _masked_mean(price, charging)
+        avg_export_price = _masked_mean(price, discharging)
+        avg_solar_export_price = _masked_mean(price, exporting)
+        avg_price = price.mean(dtype=np.float64) if price.size else np.nan
     
     # Calculate actual round trip efficiency based on energy flows
     total_energy_consumed = total_charge
@@ -45,16 +144,6 @@ def calculate_year_summary(intervals_df: pd.DataFrame, year: int) -> dict:
         round_trip_efficiency = total_energy_delivered / total_energy_consumed
     else:
         round_trip_efficiency = 0.0
-    
-    # Price metrics
-    charge_prices = intervals_df[intervals_df["p_charge_mw"] > 0]["price"]
-    discharge_prices = intervals_df[intervals_df["p_discharge_mw"] > 0]["price"]
-    solar_export_prices = intervals_df[intervals_df["p_solar_export_mw"] > 0]["price"]
-    
-    avg_import_price = charge_prices.mean() if not charge_prices.empty else 0.0
-    avg_export_price = discharge_prices.mean() if not discharge_prices.empty else 0.0
-    avg_solar_export_price = solar_export_prices.mean() if not solar_export_prices.empty else 0.0
-    avg_price = intervals_df["price"].mean()
 
     # Fixed charges (yearly)
     total_fixed_charges = 5000.0  # $5k per year
@@ -86,6 +175,125 @@ def calculate_year_summary(intervals_df: pd.DataFrame, year: int) -> dict:
     }
 
 
+# Traces longer than LTTB_THRESHOLD points are downsampled to PLOT_MAX_POINTS
+PLOT_MAX_POINTS = 2000
+LTTB_THRESHOLD = 4000
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int = PLOT_MAX_POINTS) -> np.ndarray:
+    """
+    Row positions kept when downsampling a series with Largest-Triangle-Three-Buckets.
+    
+    Keeps the first and last points and, for each of ``n_out - 2`` buckets,
+    the point forming the largest triangle with the previously kept point
+    and the average of the next bucket, which preserves peaks and troughs.
+    ``x`` is numeric (e.g. int64 epoch values).
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    xf = np.asarray(x, dtype=np.float64)
+    yf = np.asarray(y, dtype=np.float64)
+    
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = xf[hi:edges[i + 2]].mean()
+            next_y = yf[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = xf[n - 1], yf[n - 1]
+        
+        area = np.abs(
+            (xf[a] - next_x) * (yf[lo:hi] - yf[a])
+            - (xf[a] - xf[lo:hi]) * (next_y - yf[a])
+        )
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    
+    return keep
+
+
+def _plot_arrays(plot_data: pd.DataFrame, columns: list):
+    """
+    Shared x array and per-column y arrays for plot traces.
+    
+    Long periods are LTTB-downsampled with one row selection for all columns:
+    the union of each column's picks, so every series keeps its peaks and all
+    traces share the same x values.
+    """
+    # Plain ms-precision datetimes and float32 values serialize compactly
+    x = plot_data.index.to_numpy().astype('datetime64[ms]')
+    ys = {column: plot_data[column].to_numpy(np.float32) for column in columns}
+    if len(x) > LTTB_THRESHOLD:
+        x_num = x.view(np.int64)
+        per_series = max(3, PLOT_MAX_POINTS // len(columns))
+        keep = np.unique(np.concatenate([
+            _lttb_indices(x_num, y, per_series) for y in ys.values()
+        ]))
+        x = x[keep]
+        ys = {column: y[keep] for column, y in ys.items()}
+    return x, ys
+
+
+def intervals_to_parquet(intervals_df: pd.DataFrame) -> bytes:
+    """Serialize interval results to zstd-compressed Parquet bytes."""
+    buffer = io.BytesIO()
+    intervals_df.to_parquet(buffer, engine='pyarrow', compression='zstd')
+    return buffer.getvalue()
+
+
+def intervals_to_csv(intervals_df: pd.DataFrame) -> bytes:
+    """Serialize interval results to CSV bytes using Arrow's vectorized writer."""
+    table = pa.Table.from_pandas(intervals_df.reset_index(), preserve_index=False)
+    # Intervals sit on a minute grid, so second precision keeps timestamps readable
+    table = table.set_column(0, table.field(0).name, table.column(0).cast(pa.timestamp('s')))
+    
+    buffer = io.BytesIO()
+    pa_csv.write_csv(table, buffer)
+    return buffer.getvalue()
+
+
+def calculate_price_metrics(intervals_df: pd.DataFrame) -> dict:
+    """Calculate the Price Analysis metrics for a set of intervals."""
+    n = len(intervals_df)
+    price = intervals_df['price'].to_numpy(np.float64)
+    
+    # One (N, 4) weight matrix: charge/discharge masks for the BESS averages
+    # and solar/export power for the weighted prices. A single product with
+    # the price vector gives every numerator, a column sum every denominator.
+    # Interval width is constant, so it cancels out of the weighted prices.
+    weights = np.empty((n, 4), order='F')
+    weights[:, 0] = intervals_df['p_charge_mw'].to_numpy() > 0
+    weights[:, 1] = intervals_df['p_discharge_mw'].to_numpy() > 0
+    weights[:, 2] = intervals_df['solar_power_mw'].to_numpy()
+    weights[:, 3] = intervals_df['p_solar_export_mw'].to_numpy()
+    
+    weighted_sums = price @ weights
+    weight_totals = weights.sum(axis=0)
+    averages = np.divide(
+        weighted_sums, weight_totals,
+        out=np.zeros(4), where=weight_totals > 0,
+    )
+    bess_import_avg_price, bess_export_avg_price, solar_weighted_price, solar_export_weighted_price = averages
+    
+    return {
+        "time_weighted_avg_price": price.mean() if n else np.nan,
+        "bess_import_avg_price": bess_import_avg_price,
+        "bess_export_avg_price": bess_export_avg_price,
+        "solar_weighted_price": solar_weighted_price,
+        "solar_export_weighted_price": solar_export_weighted_price,
+        # Spread price captured (export - import)
+        "spread_price_captured": bess_export_avg_price - bess_import_avg_price,
+    }
+
+
 def create_hybrid_config_from_ui():
     """Create configuration from Streamlit UI inputs."""
     
@@ -168,6 +376,111 @@ def create_hybrid_config_from_ui():
     return battery, sim, market, windows, tariffs, solar
 
 
+@st.fragment
+def _render_plots(intervals: pd.DataFrame, solar_enabled: bool):
+    """
+    Render the time series plots.
+    
+    Runs as a fragment so that changing the plotting period or custom range
+    reruns only this section, not the KPIs and price analysis above it.
+    """
+    st.header("📊 Time Series Analysis")
+
+    # Select time period for plotting
+    time_period = st.selectbox(
+        "Select time period for plotting:",
+        ["First Week", "First Month", "Full Period", "Custom Range"],
+        index=0
+    )
+
+    if time_period == "First Week":
+        plot_data = intervals.head(24 * 7)  # First week
+    elif time_period == "First Month":
+        plot_data = intervals.head(24 * 30)  # First month
+    elif time_period == "Custom Range":
+        start_idx = st.number_input("Start hour", min_value=0, max_value=len(intervals)-1, value=0)
+        end_idx = st.number_input("End hour", min_value=start_idx+1, max_value=len(intervals), value=min(start_idx+168, len(intervals)))
+        plot_data = intervals.iloc[start_idx:end_idx]
+    else:
+        plot_data = intervals
+
+    # Long periods are LTTB-downsampled and drawn with WebGL traces
+    columns = ['soc_mwh', 'p_charge_mw', 'p_discharge_mw', 'price']
+    if solar_enabled:
+        columns.append('p_solar_export_mw')
+    x, ys = _plot_arrays(plot_data, columns)
+
+    # SOC and Power plot
+    power_traces = [
+        go.Scattergl(
+            x=x,
+            y=ys['soc_mwh'],
+            mode='lines',
+            name='SOC (MWh)',
+            line=dict(color='blue', width=2),
+            fill='tonexty',
+            fillcolor='rgba(0,100,200,0.2)'
+        ),
+        go.Scattergl(
+            x=x,
+            y=ys['p_charge_mw'],
+            mode='lines',
+            name='Charge Power (MW)',
+            line=dict(color='green', width=2)
+        ),
+        go.Scattergl(
+            x=x,
+            y=-ys['p_discharge_mw'],
+            mode='lines',
+            name='Discharge Power (MW)',
+            line=dict(color='red', width=2)
+        ),
+    ]
+
+    if solar_enabled:
+        power_traces.append(go.Scattergl(
+            x=x,
+            y=ys['p_solar_export_mw'],
+            mode='lines',
+            name='Solar Export (MW)',
+            line=dict(color='orange', width=2)
+        ))
+
+    fig_soc = go.Figure()
+    fig_soc.add_traces(power_traces)
+
+    fig_soc.update_layout(
+        title="Battery SOC and Power Flows",
+        xaxis_title="Time",
+        yaxis_title="Power (MW) / SOC (MWh)",
+        hovermode='x unified',
+        height=500
+    )
+
+    st.plotly_chart(fig_soc, use_container_width=True)
+
+    # Price plot
+    fig_price = go.Figure()
+
+    fig_price.add_trace(go.Scattergl(
+        x=x,
+        y=ys['price'],
+        mode='lines',
+        name='Electricity Price',
+        line=dict(color='purple', width=2)
+    ))
+
+    fig_price.update_layout(
+        title="Electricity Price",
+        xaxis_title="Time",
+        yaxis_title="Price (AUD/MWh)",
+        hovermode='x unified',
+        height=400
+    )
+
+    st.plotly_chart(fig_price, use_container_width=True)
+
+
 def main():
     """Main Streamlit app."""
     st.set_page_config(
@@ -388,8 +701,8 @@ def main():
                 # Create configuration
                 battery, sim, market, windows, tariffs, solar = create_hybrid_config_from_ui()
                 
-                # Run simulation
-                results = run_simulation_hybrid(
+                # Run simulation (cached on the configuration)
+                results = run_simulation_cached(
                     battery=battery,
                     sim=sim,
                     market=market,
@@ -398,8 +711,15 @@ def main():
                     solar=solar,
                 )
                 
-                # Store results in session state
+                # Store results in session state, indexed by year once so
+                # that changing the selected year is a lookup, not a scan
                 st.session_state['simulation_results'] = results
+                bounds = year_bounds(results['intervals'])
+                st.session_state['year_bounds'] = bounds
+                st.session_state['year_summaries'] = {
+                    year: calculate_year_summary(results['intervals'].iloc[lo:hi], year)
+                    for year, (lo, hi) in bounds.items()
+                }
                 st.session_state['simulation_config'] = {
                     'battery': battery,
                     'sim': sim,
@@ -422,15 +742,18 @@ def main():
         # Get selected year from session state
         selected_year = st.session_state.get('selected_year', 2024)
         
-        # Filter intervals to selected year
-        year_intervals = all_intervals[all_intervals.index.year == selected_year]
+        # Look up the precomputed row range for the selected year
+        bounds = st.session_state['year_bounds']
         
-        if year_intervals.empty:
-            st.warning(f"No data available for year {selected_year}. Available years: {sorted(all_intervals.index.year.unique())}")
+        if selected_year in bounds:
+            lo, hi = bounds[selected_year]
+            year_intervals = all_intervals.iloc[lo:hi]
+            # Per-year summaries are computed once when the simulation finishes
+            summary = st.session_state['year_summaries'][selected_year]
+        else:
+            st.warning(f"No data available for year {selected_year}. Available years: {sorted(bounds)}")
             year_intervals = all_intervals  # Fallback to all data
-        
-        # Recalculate summary for selected year
-        summary = calculate_year_summary(year_intervals, selected_year)
+            summary = calculate_year_summary(year_intervals, selected_year)
         intervals = year_intervals
         
         # Year selector at the top of results
@@ -510,26 +833,13 @@ def main():
         st.header("💰 Price Analysis")
         
         # Calculate price metrics for selected year
-        time_weighted_avg_price = intervals['price'].mean()
-        
-        # BESS Import average price (when charging)
-        bess_import_prices = intervals[intervals['p_charge_mw'] > 0]['price']
-        bess_import_avg_price = bess_import_prices.mean() if not bess_import_prices.empty else 0
-        
-        # BESS Export average price (when discharging)
-        bess_export_prices = intervals[intervals['p_discharge_mw'] > 0]['price']
-        bess_export_avg_price = bess_export_prices.mean() if not bess_export_prices.empty else 0
-        
-        # Solar weighted price (total production)
-        solar_generation = intervals['solar_power_mw'] * (intervals.index.to_series().diff().dt.total_seconds() / 3600)
-        solar_weighted_price = (intervals['price'] * solar_generation).sum() / solar_generation.sum() if solar_generation.sum() > 0 else 0
-        
-        # Solar export weighted price (after BESS)
-        solar_export_energy = intervals['p_solar_export_mw'] * (intervals.index.to_series().diff().dt.total_seconds() / 3600)
-        solar_export_weighted_price = (intervals['price'] * solar_export_energy).sum() / solar_export_energy.sum() if solar_export_energy.sum() > 0 else 0
-        
-        # Spread price captured (export - import)
-        spread_price_captured = bess_export_avg_price - bess_import_avg_price
+        price_metrics = calculate_price_metrics(intervals)
+        time_weighted_avg_price = price_metrics['time_weighted_avg_price']
+        bess_import_avg_price = price_metrics['bess_import_avg_price']
+        bess_export_avg_price = price_metrics['bess_export_avg_price']
+        solar_weighted_price = price_metrics['solar_weighted_price']
+        solar_export_weighted_price = price_metrics['solar_export_weighted_price']
+        spread_price_captured = price_metrics['spread_price_captured']
         
         # Display price metrics in columns
         col1, col2, col3 = st.columns(3)
@@ -597,107 +907,27 @@ def main():
             st.dataframe(pd.DataFrame(financial_data), use_container_width=True)
         
         # Time series plots
-        st.header("📊 Time Series Analysis")
-        
-        # Select time period for plotting
-        time_period = st.selectbox(
-            "Select time period for plotting:",
-            ["First Week", "First Month", "Full Period", "Custom Range"],
-            index=0
-        )
-        
-        if time_period == "First Week":
-            plot_data = intervals.head(24 * 7)  # First week
-        elif time_period == "First Month":
-            plot_data = intervals.head(24 * 30)  # First month
-        elif time_period == "Custom Range":
-            start_idx = st.number_input("Start hour", min_value=0, max_value=len(intervals)-1, value=0)
-            end_idx = st.number_input("End hour", min_value=start_idx+1, max_value=len(intervals), value=min(start_idx+168, len(intervals)))
-            plot_data = intervals.iloc[start_idx:end_idx]
-        else:
-            plot_data = intervals
-        
-        # SOC and Power plot
-        fig_soc = go.Figure()
-        
-        # Add SOC trace
-        fig_soc.add_trace(go.Scatter(
-            x=plot_data.index,
-            y=plot_data['soc_mwh'],
-            mode='lines',
-            name='SOC (MWh)',
-            line=dict(color='blue', width=2),
-            fill='tonexty',
-            fillcolor='rgba(0,100,200,0.2)'
-        ))
-        
-        # Add power traces
-        fig_soc.add_trace(go.Scatter(
-            x=plot_data.index,
-            y=plot_data['p_charge_mw'],
-            mode='lines',
-            name='Charge Power (MW)',
-            line=dict(color='green', width=2)
-        ))
-        
-        fig_soc.add_trace(go.Scatter(
-            x=plot_data.index,
-            y=-plot_data['p_discharge_mw'],
-            mode='lines',
-            name='Discharge Power (MW)',
-            line=dict(color='red', width=2)
-        ))
-        
-        if solar_enabled:
-            fig_soc.add_trace(go.Scatter(
-                x=plot_data.index,
-                y=plot_data['p_solar_export_mw'],
-                mode='lines',
-                name='Solar Export (MW)',
-                line=dict(color='orange', width=2)
-            ))
-        
-        fig_soc.update_layout(
-            title="Battery SOC and Power Flows",
-            xaxis_title="Time",
-            yaxis_title="Power (MW) / SOC (MWh)",
-            hovermode='x unified',
-            height=500
-        )
-        
-        st.plotly_chart(fig_soc, use_container_width=True)
-        
-        # Price plot
-        fig_price = go.Figure()
-        
-        fig_price.add_trace(go.Scatter(
-            x=plot_data.index,
-            y=plot_data['price'],
-            mode='lines',
-            name='Electricity Price',
-            line=dict(color='purple', width=2)
-        ))
-        
-        fig_price.update_layout(
-            title="Electricity Price",
-            xaxis_title="Time",
-            yaxis_title="Price (AUD/MWh)",
-            hovermode='x unified',
-            height=400
-        )
-        
-        st.plotly_chart(fig_price, use_container_width=True)
+        _render_plots(intervals, solar_enabled)
         
         # Download results
         st.header("💾 Download Results")
         
-        csv_data = intervals.to_csv()
+        # Files are serialized only when a button is clicked, not on every rerun
+        file_stem = f"hybrid_pv_bess_simulation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         st.download_button(
-            label="Download Simulation Data (CSV)",
-            data=csv_data,
-            file_name=f"hybrid_pv_bess_simulation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
+            label="Download Simulation Data (Parquet)",
+            data=lambda: intervals_to_parquet(intervals),
+            file_name=f"{file_stem}.parquet",
+            mime="application/octet-stream"
         )
+        
+        with st.expander("Other formats"):
+            st.download_button(
+                label="Download Simulation Data (CSV)",
+                data=lambda: intervals_to_csv(intervals),
+                file_name=f"{file_stem}.csv",
+                mime="text/csv"
+            )
 
 
 if __name__ == "__main__":
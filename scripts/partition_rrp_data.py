@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Re-layout the organized RRP parquet files as a Hive-partitioned dataset.
+
+Writes data/organized/rrp/region=<REGION>/year=<YYYY>/*.parquet so that
+loaders only open the files for the years a query touches, and row-group
+statistics (one group per ~month) prune further within a year.
+"""
+
+import sys
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pathlib import Path
+
+ORGANIZED_DIR = Path("data/organized")
+PARTITIONED_DIR = ORGANIZED_DIR / "rrp"
+
+# One row group per ~month of 5-minute intervals
+ROWS_PER_GROUP = 31 * 288
+
+
+def partition_region(source_file: Path, region: str) -> int:
+    """Write one region's RRP file as year partitions; returns rows written."""
+    table = pq.read_table(source_file)
+    table = table.sort_by("SETTLEMENTDATE")
+    table = table.append_column("year", pc.year(table["SETTLEMENTDATE"]))
+
+    ds.write_dataset(
+        table,
+        PARTITIONED_DIR / f"region={region}",
+        format="parquet",
+        partitioning=["year"],
+        partitioning_flavor="hive",
+        min_rows_per_group=ROWS_PER_GROUP,
+        max_rows_per_group=ROWS_PER_GROUP,
+        existing_data_behavior="delete_matching",
+    )
+    return table.num_rows
+
+
+def main():
+    """Partition every organized RRP file by region and year."""
+    source_files = sorted(ORGANIZED_DIR.glob("*_rrp_2020_2025.parquet"))
+    if not source_files:
+        print(f"No RRP files found in {ORGANIZED_DIR}")
+        return 1
+
+    for source_file in source_files:
+        region = source_file.stem.replace("_rrp_2020_2025", "")
+        rows = partition_region(source_file, region)
+        print(f"  {region}: {rows:,} rows -> {PARTITIONED_DIR / f'region={region}'}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,12 @@
 Run hybrid PV+BESS simulation for NSW 2024/2025.
 """
 
+import logging
+import os
 import sys
 import pandas as pd
+from datetime import datetime
 from pathlib import Path
-sys.path.append(str(Path('src').resolve()))
 
 from battery_sim.config import (
     BatteryConfig,
@@ -20,7 +22,9 @@ from battery_sim.config import (
     DemandCharge,
 )
 from battery_sim.sim_hybrid import run_simulation_hybrid
-from src.utils.file_naming import create_timestamped_file
+from utils.file_naming import ensure_output_directory, open_next_versioned_file
+
+logger = logging.getLogger("hybrid_pv_bess")
 
 
 def create_hybrid_config():
@@ -92,18 +96,19 @@ def create_hybrid_config():
 
 def main():
     """Run hybrid PV+BESS simulation."""
-    print("Starting hybrid PV+BESS simulation...")
-    
     # Create configuration
     battery, sim, market, windows, tariffs, solar = create_hybrid_config()
     
-    print(f"Configuration:")
-    print(f"  Battery: {battery.power_mw}MW / {battery.energy_mwh}MWh")
-    print(f"  Solar: {solar.capacity_mw}MW ({'enabled' if solar.enabled else 'disabled'})")
-    print(f"  Charging: {'Bidirectional' if solar.bidirectional_charging else 'PV-only'}")
-    print(f"  Period: {sim.start} to {sim.end}")
-    print(f"  Region: {market.region}")
-    print()
+    logger.info("\n".join([
+        "Starting hybrid PV+BESS simulation...",
+        "Configuration:",
+        f"  Battery: {battery.power_mw}MW / {battery.energy_mwh}MWh",
+        f"  Solar: {solar.capacity_mw}MW ({'enabled' if solar.enabled else 'disabled'})",
+        f"  Charging: {'Bidirectional' if solar.bidirectional_charging else 'PV-only'}",
+        f"  Period: {sim.start} to {sim.end}",
+        f"  Region: {market.region}",
+        "",
+    ]))
     
     try:
         # Run simulation
@@ -116,54 +121,69 @@ def main():
             solar=solar,
         )
         
-        # Print summary
+        # Log summary as a single record
         summary = results["summary"]
-        print("Simulation Results:")
-        print(f"  Total Charge: {summary['total_charge_mwh']:.2f} MWh")
-        print(f"  Total Discharge: {summary['total_discharge_mwh']:.2f} MWh")
-        print(f"  Total Solar Export: {summary['total_solar_export_mwh']:.2f} MWh")
-        print(f"  Round Trip Efficiency: {summary['round_trip_efficiency']:.1%}")
-        print(f"  Avg Import Price: ${summary['avg_import_price']:.2f}/MWh")
-        print(f"  Avg Export Price: ${summary['avg_export_price']:.2f}/MWh")
-        print(f"  Avg Solar Export Price: ${summary['avg_solar_export_price']:.2f}/MWh")
-        print(f"  Total Revenue: ${summary['energy_revenue_aud']:,.2f}")
-        print(f"  Total Cost: ${summary['energy_cost_aud']:,.2f}")
-        print(f"  Network Cost: ${summary['network_cost_aud']:,.2f}")
-        print(f"  Gross Profit: ${summary['gross_profit_aud']:,.2f}")
-        print(f"  Net Profit: ${summary['net_profit_aud']:,.2f}")
-        print(f"  Initial SOC: {summary['initial_soc_mwh']:.2f} MWh")
-        print(f"  Final SOC: {summary['final_soc_mwh']:.2f} MWh")
-        print()
+        logger.info("\n".join([
+            "Simulation Results:",
+            f"  Total Charge: {summary['total_charge_mwh']:.2f} MWh",
+            f"  Total Discharge: {summary['total_discharge_mwh']:.2f} MWh",
+            f"  Total Solar Export: {summary['total_solar_export_mwh']:.2f} MWh",
+            f"  Round Trip Efficiency: {summary['round_trip_efficiency']:.1%}",
+            f"  Avg Import Price: ${summary['avg_import_price']:.2f}/MWh",
+            f"  Avg Export Price: ${summary['avg_export_price']:.2f}/MWh",
+            f"  Avg Solar Export Price: ${summary['avg_solar_export_price']:.2f}/MWh",
+            f"  Total Revenue: ${summary['energy_revenue_aud']:,.2f}",
+            f"  Total Cost: ${summary['energy_cost_aud']:,.2f}",
+            f"  Network Cost: ${summary['network_cost_aud']:,.2f}",
+            f"  Gross Profit: ${summary['gross_profit_aud']:,.2f}",
+            f"  Net Profit: ${summary['net_profit_aud']:,.2f}",
+            f"  Initial SOC: {summary['initial_soc_mwh']:.2f} MWh",
+            f"  Final SOC: {summary['final_soc_mwh']:.2f} MWh",
+            "",
+        ]))
         
-        # Save results
-        output_dir = Path("outputs/hybrid_pv_bess")
-        output_file = create_timestamped_file(
+        # Save results - one output directory check and one timestamp shared by all files
+        output_dir = ensure_output_directory(Path("outputs/hybrid_pv_bess"))
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        fd, output_file = open_next_versioned_file(
             "NSW1_Hybrid_PV_BESS_2024",
             "parquet",
-            output_dir
+            output_dir,
+            timestamp=timestamp,
         )
         
-        # Save intervals data
-        results["intervals"].to_parquet(output_file)
-        print(f"Results saved to: {output_file}")
+        # Save intervals data (zstd is much smaller than the default snappy)
+        with os.fdopen(fd, "wb") as f:
+            results["intervals"].to_parquet(
+                f,
+                engine="pyarrow",
+                compression="zstd",
+                compression_level=3,
+                row_group_size=65536,
+            )
+        logger.info("Results saved to: %s", output_file)
         
         # Save summary as CSV
-        summary_file = create_timestamped_file(
+        fd, summary_file = open_next_versioned_file(
             "NSW1_Hybrid_PV_BESS_2024_Summary",
             "csv",
-            output_dir
+            output_dir,
+            timestamp=timestamp,
         )
         
         summary_df = pd.DataFrame([summary])
-        summary_df.to_csv(summary_file, index=False)
-        print(f"Summary saved to: {summary_file}")
+        with os.fdopen(fd, "w", newline="") as f:
+            summary_df.to_csv(f, index=False)
+        logger.info("Summary saved to: %s", summary_file)
         
     except Exception as e:
-        print(f"Error running simulation: {e}")
+        logger.error("Error running simulation: %s", e)
         return 1
     
     return 0
 
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logger.setLevel(logging.INFO)
     sys.exit(main())
@@ -13,7 +13,7 @@ from .config import (
     ValidationConfig,
     SolarPVConfig
 )
-from .sim_hybrid import run_simulation_hybrid
+from .sim_hybrid import run_simulation_hybrid, run_simulations_batch, run_sweep
 
 __all__ = [
     "BatteryConfig",
@@ -30,6 +30,8 @@ __all__ = [
     "ValidationConfig",
     "SolarPVConfig",
     "run_simulation_hybrid",
+    "run_simulations_batch",
+    "run_sweep",
 ]
 
 
@@ -0,0 +1,152 @@
+"""
+Numeric kernels for the hybrid dispatch simulation.
+
+The functions here are plain Python over NumPy arrays and scalars. Callers
+(sim_hybrid, and the web app for year_summary) JIT-compile them with numba
+when it is installed. Keeping them in this module, rather than in a script,
+gives numba's on-disk cache a stable module to key on. sim_hybrid uses an
+ahead-of-time compiled dispatch_loop instead if one has been built with:
+
+    python scripts/build_kernels.py
+
+The compiled module records a hash of the kernel source it was built from;
+sim_hybrid ignores it, with a warning, once dispatch_loop has changed.
+"""
+
+import functools
+import hashlib
+import inspect
+from pathlib import Path
+import numpy as np
+
+
+def dispatch_loop(solar_power, charge_mask, discharge_mask,
+                  soc_init, soc_min, soc_max, p_max, eta_c, eta_d,
+                  solar_eff, dt_h, solar_enabled, grid_charging):
+    """
+    Step the battery SOC through every interval.
+    
+    Returns (soc, p_solar_charge, p_grid_charge, p_discharge) arrays. Only scalar
+    locals are touched inside the loop so it compiles cleanly under numba.
+    """
+    n = solar_power.shape[0]
+    soc_out = np.empty(n)
+    p_solar_charge = np.zeros(n)
+    p_grid_charge = np.zeros(n)
+    p_discharge = np.zeros(n)
+    soc = soc_init
+    # Loop-invariant reciprocal for the charge caps. The discharge step keeps
+    # its divisions: it must land SOC exactly on soc_min, or a rounding
+    # residue is discharged again in the next window interval
+    inv_dt = 1.0 / dt_h
+    
+    for i in range(n):
+        # First priority: Use solar to charge battery if in charge window and battery not full
+        if solar_enabled and solar_power[i] > 0 and charge_mask[i] and soc < soc_max:
+            # Limited by battery power, SOC headroom and available solar power
+            chg = min(p_max, (soc_max - soc) * inv_dt, solar_power[i])
+            p_solar_charge[i] = chg
+            # Apply solar efficiency to SOC update (energy stored in battery)
+            soc += chg * dt_h * solar_eff
+        
+        # Grid charging logic (only if bidirectional enabled)
+        if grid_charging and charge_mask[i] and soc < soc_max:
+            chg = min(p_max, (soc_max - soc) * inv_dt)
+            p_grid_charge[i] = chg
+            # Apply battery efficiency to SOC update (energy stored in battery)
+            soc += chg * dt_h * eta_c
+        
+        # Discharge logic
+        if discharge_mask[i] and soc > soc_min:
+            # Energy delivered to grid = available energy * discharge efficiency
+            dis = min(p_max, (soc - soc_min) * eta_d / dt_h)
+            p_discharge[i] = dis
+            # SOC decreases by the energy removed from battery (before efficiency)
+            soc -= dis * dt_h / eta_d
+        
+        # Ensure SOC stays within bounds (min/max lower to branchless instructions)
+        soc = min(soc_max, max(soc_min, soc))
+        soc_out[i] = soc
+    
+    return soc_out, p_solar_charge, p_grid_charge, p_discharge
+
+
+def year_summary(price, p_charge, p_discharge, p_solar_export,
+                 e_charge, e_discharge, e_solar_export,
+                 revenue, cost, network_cost):
+    """
+    Fused single pass over the interval arrays for the web app's year summary.
+    
+    Returns the energy, revenue and cost totals, the price sum, and the price
+    sums and counts over the charging, discharging and solar export intervals.
+    """
+    total_charge = 0.0
+    total_discharge = 0.0
+    total_solar_export = 0.0
+    total_revenue = 0.0
+    total_cost = 0.0
+    total_network_cost = 0.0
+    price_sum = 0.0
+    import_sum = 0.0
+    export_sum = 0.0
+    solar_export_sum = 0.0
+    n_import = 0
+    n_export = 0
+    n_solar_export = 0
+    
+    for i in range(price.shape[0]):
+        total_charge += e_charge[i]
+        total_discharge += e_discharge[i]
+        total_solar_export += e_solar_export[i]
+        total_revenue += revenue[i]
+        total_cost += cost[i]
+        total_network_cost += network_cost[i]
+        price_sum += price[i]
+        if p_charge[i] > 0:
+            import_sum += price[i]
+            n_import += 1
+        if p_discharge[i] > 0:
+            export_sum += price[i]
+            n_export += 1
+        if p_solar_export[i] > 0:
+            solar_export_sum += price[i]
+            n_solar_export += 1
+    
+    return (
+        total_charge, total_discharge, total_solar_export,
+        total_revenue, total_cost, total_network_cost,
+        price_sum, import_sum, n_import, export_sum, n_export,
+        solar_export_sum, n_solar_export,
+    )
+
+
+# Signature of the ahead-of-time build: float64 interval arrays, boolean
+# window masks, float64 battery parameters and boolean mode flags
+DISPATCH_LOOP_SIGNATURE = (
+    "UniTuple(f8[::1], 4)"
+    "(f8[::1], b1[::1], b1[::1], f8, f8, f8, f8, f8, f8, f8, f8, b1, b1)"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def dispatch_loop_hash() -> int:
+    """Hash of dispatch_loop's source and signature, as a non-negative int64."""
+    source = inspect.getsource(dispatch_loop) + DISPATCH_LOOP_SIGNATURE
+    digest = hashlib.sha256(source.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little") & 0x7FFFFFFFFFFFFFFF
+
+
+def build():
+    """Compile the kernels ahead of time into battery_sim/_dispatch_aot."""
+    from numba.pycc import CC
+    
+    built_hash = dispatch_loop_hash()
+    
+    def source_hash():
+        return built_hash
+    
+    cc = CC("_dispatch_aot")
+    cc.output_dir = str(Path(__file__).parent)
+    cc.export("dispatch_loop", DISPATCH_LOOP_SIGNATURE)(dispatch_loop)
+    cc.export("source_hash", "i8()")(source_hash)
+    cc.compile()
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SolarPVConfig:
     """Configuration for solar PV system in hybrid PV+BESS setup."""
     enabled: bool = False
@@ -13,7 +13,7 @@ class SolarPVConfig:
     bidirectional_charging: bool = False  # Allow grid charging (True) or PV-only charging (False)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BatteryConfig:
     name: str
     power_mw: float
@@ -44,7 +44,7 @@ class BatteryConfig:
     emergency_reserve_mwh: float = 0.0  # Additional reserve for emergencies
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SimulationConfig:
     start: str
     end: str
@@ -59,7 +59,7 @@ class SimulationConfig:
     temperature_profile_file: Optional[str] = None  # Path to temperature data
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketConfig:
     region: str  # one of NSW1/VIC1/QLD1/SA1
     price_source: str = "dispatchprice"
@@ -86,7 +86,7 @@ class MarketConfig:
     fcas_lower_reg: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DispatchWindowsConfig:
     charge_window: Tuple[str, str]  # ("HH:MM", "HH:MM")
     discharge_window: Tuple[str, str]  # ("HH:MM", "HH:MM")
@@ -97,7 +97,7 @@ class DispatchWindowsConfig:
     weekend_discharge_window: Optional[Tuple[str, str]] = None
     holiday_charge_window: Optional[Tuple[str, str]] = None
     holiday_discharge_window: Optional[Tuple[str, str]] = None
-    holiday_dates: List[str] = None  # List of holiday dates in YYYY-MM-DD format
+    holiday_dates: Tuple[str, ...] = ()  # Holiday dates in YYYY-MM-DD format
     
     # Price-based dispatch triggers
     charge_price_threshold: Optional[float] = None  # Charge when price below this
@@ -111,19 +111,19 @@ class DispatchWindowsConfig:
     enable_frequency_regulation: bool = False  # Provide frequency regulation services
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FixedCharge:
     cadence: str  # 'daily' | 'monthly'
     amount_aud: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VolumeCharge:
     import_aud_per_mwh: float = 0.0
     export_aud_per_mwh: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DemandCharge:
     window: Tuple[str, str]  # ("HH:MM", "HH:MM")
     cadence: str  # 'monthly'
@@ -131,7 +131,7 @@ class DemandCharge:
     rate_aud_per_kw: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NetworkTariffsConfig:
     fixed: FixedCharge
     volume: VolumeCharge
@@ -149,9 +149,9 @@ class NetworkTariffsConfig:
     tou_peak_rate_aud_per_mwh: float = 0.0
     tou_off_peak_rate_aud_per_mwh: float = 0.0
     tou_shoulder_rate_aud_per_mwh: float = 0.0
-    tou_peak_hours: List[Tuple[str, str]] = None  # Peak time windows
-    tou_off_peak_hours: List[Tuple[str, str]] = None  # Off-peak time windows
-    tou_shoulder_hours: List[Tuple[str, str]] = None  # Shoulder time windows
+    tou_peak_hours: Tuple[Tuple[str, str], ...] = ()  # Peak time windows
+    tou_off_peak_hours: Tuple[Tuple[str, str], ...] = ()  # Off-peak time windows
+    tou_shoulder_hours: Tuple[Tuple[str, str], ...] = ()  # Shoulder time windows
     
     # Renewable energy certificates
     enable_lgc: bool = False  # Large-scale Generation Certificates
@@ -165,7 +165,7 @@ class NetworkTariffsConfig:
     grid_emissions_factor_tonnes_per_mwh: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OperationalConstraints:
     """Operational constraints and limits"""
     max_continuous_charge_hours: Optional[float] = None
@@ -176,7 +176,7 @@ class OperationalConstraints:
     max_monthly_energy_throughput_mwh: Optional[float] = None
     
     # Maintenance constraints
-    maintenance_windows: List[Tuple[str, str]] = None  # Maintenance periods
+    maintenance_windows: Tuple[Tuple[str, str], ...] = ()  # Maintenance periods
     maintenance_energy_penalty: float = 0.0  # Energy penalty during maintenance
     
     # Environmental constraints
@@ -185,7 +185,7 @@ class OperationalConstraints:
     temp_derating_factor: float = 0.0  # Power derating per degree above/below optimal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FinancialConfig:
     """Financial parameters and costs"""
     # Capital costs
@@ -214,7 +214,7 @@ class FinancialConfig:
     enable_grid_services: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportingConfig:
     """Reporting and output configuration"""
     # Output formats
@@ -244,7 +244,7 @@ class ReportingConfig:
     create_subdirectories: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationConfig:
     """Data validation and quality checks"""
     enable_validation: bool = True
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import warnings
 from dataclasses import asdict
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -14,68 +17,107 @@ from .config import (
     NetworkTariffsConfig,
     SolarPVConfig,
 )
-import sys
-from pathlib import Path
+from organized_data_loader import OrganizedDataLoader
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+from . import _kernels
 
-from organized_data_loader import OrganizedDataLoader
+
+def _aot_dispatch_loop():
+    """Ahead-of-time compiled dispatch_loop, if built from the current source."""
+    try:
+        # Built with scripts/build_kernels.py
+        from . import _dispatch_aot
+    except ImportError:
+        return None
+    source_hash = getattr(_dispatch_aot, "source_hash", None)
+    if source_hash is None or source_hash() != _kernels.dispatch_loop_hash():
+        warnings.warn(
+            "battery_sim._dispatch_aot was built from a different dispatch_loop; "
+            "using the JIT kernel instead. Rebuild with scripts/build_kernels.py"
+        )
+        return None
+    return _dispatch_aot.dispatch_loop
+
+
+_dispatch_loop = _aot_dispatch_loop()
+if _dispatch_loop is None:
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; the dispatch loop then runs as plain Python
+        njit = None
+    _dispatch_loop = (
+        njit(cache=True)(_kernels.dispatch_loop) if njit is not None else _kernels.dispatch_loop
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _loader(organized_data_path: str = "data/organized") -> OrganizedDataLoader:
+    """Shared data loader, so repeated runs skip the path checks."""
+    return OrganizedDataLoader(organized_data_path)
 
 
-def _is_in_window(ts: pd.Timestamp, start_hm: str, end_hm: str) -> bool:
-    """Check if timestamp is within the specified time window."""
-    hm = ts.strftime("%H:%M")
-    if start_hm <= end_hm:
-        return start_hm <= hm < end_hm
-    # window crosses midnight
-    return hm >= start_hm or hm < end_hm
+def _parse_hm(hm: str) -> int:
+    """Convert an "HH:MM" time of day to minutes after midnight."""
+    hours, minutes = hm.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _window_mask(minute_of_day: np.ndarray, window) -> np.ndarray:
+    """Boolean mask of the intervals whose start time falls in an ("HH:MM", "HH:MM") window."""
+    start = _parse_hm(window[0])
+    end = _parse_hm(window[1])
+    
+    # The window repeats daily, so build it once per minute of the day and
+    # look every interval up in it. Start inclusive, end exclusive, may cross
+    # midnight.
+    day = np.zeros(24 * 60, dtype=np.bool_)
+    if start <= end:
+        day[start:end] = True
+    else:
+        day[start:] = True
+        day[:end] = True
+    return day[minute_of_day]
+
+
+@functools.lru_cache(maxsize=8)
+def _solar_profile_values(profile_name: str, start_date: str, end_date: str) -> np.ndarray:
+    """
+    Hourly solar power (MW) for the period, cached as a read-only array.
+    
+    Raises instead of returning a fallback, so a failed load is never cached
+    and a profile that appears later is picked up.
+    """
+    solar_file = f"data/organized/{profile_name}_1990.parquet"
+    if not Path(solar_file).exists():
+        raise FileNotFoundError(f"Solar profile {solar_file} not found")
+    
+    sim_dates = pd.date_range(start=start_date, end=end_date, freq='h')
+    solar_df = pd.read_parquet(solar_file, columns=['power_mw'])
+    solar_index = pd.to_datetime(solar_df.index)
+    
+    # Map solar data using day of year and hour: a (day, hour) lookup
+    # table indexed directly, where missing slots stay 0 (night time)
+    table = np.zeros((367, 24))
+    table[solar_index.dayofyear, solar_index.hour] = solar_df['power_mw'].fillna(0).to_numpy()
+    values = table[sim_dates.dayofyear, sim_dates.hour]
+    
+    # Shared between callers through the cache, so it must never be written
+    values.setflags(write=False)
+    return values
 
 
 def load_solar_profile(profile_name: str, start_date: str, end_date: str) -> pd.DataFrame:
     """Load solar production profile from organized data."""
-    data_loader = OrganizedDataLoader()
-    
-    # Try to load the solar profile
+    index = pd.date_range(start=start_date, end=end_date, freq='h', name='datetime')
     try:
-        solar_file = f"data/organized/{profile_name}_1990.parquet"
-        if Path(solar_file).exists():
-            solar_df = pd.read_parquet(solar_file)
-            solar_df.index = pd.to_datetime(solar_df.index)
-            
-            # Create profile for the simulation period
-            sim_start = pd.Timestamp(start_date)
-            sim_end = pd.Timestamp(end_date)
-            sim_dates = pd.date_range(start=sim_start, end=sim_end, freq='h')  # Changed from 'H' to 'h'
-            
-            # Map solar data using day of year and hour
-            solar_df['day_of_year'] = solar_df.index.dayofyear
-            solar_df['hour'] = solar_df.index.hour
-            
-            sim_profile = pd.DataFrame({'datetime': sim_dates})
-            sim_profile['day_of_year'] = sim_profile['datetime'].dt.dayofyear
-            sim_profile['hour'] = sim_profile['datetime'].dt.hour
-            
-            # Merge with solar data
-            sim_profile = sim_profile.merge(
-                solar_df[['day_of_year', 'hour', 'power_mw']], 
-                on=['day_of_year', 'hour'], 
-                how='left'
-            )
-            
-            # Fill missing values with 0 (night time)
-            sim_profile['solar_power_mw'] = sim_profile['power_mw'].fillna(0)
-            sim_profile.set_index('datetime', inplace=True)
-            
-            return sim_profile[['solar_power_mw']]
-        else:
-            print(f"Warning: Solar profile {solar_file} not found. Using zero generation.")
-            return pd.DataFrame(index=pd.date_range(start=start_date, end=end_date, freq='h'), 
-                              columns=['solar_power_mw'], data=0)
+        values = _solar_profile_values(profile_name, start_date, end_date)
+    except FileNotFoundError as e:
+        print(f"Warning: {e}. Using zero generation.")
+        values = np.zeros(len(index))
     except Exception as e:
         print(f"Error loading solar profile: {e}. Using zero generation.")
-        return pd.DataFrame(index=pd.date_range(start=start_date, end=end_date, freq='h'), 
-                          columns=['solar_power_mw'], data=0)
+        values = np.zeros(len(index))
+    return pd.DataFrame({'solar_power_mw': values}, index=index)
 
 
 def run_simulation_hybrid(
@@ -95,181 +137,171 @@ def run_simulation_hybrid(
     3. If non-bidirectional: Only charge from solar, no grid charging
     4. Discharge during discharge windows
     """
-    # Initialize organized data loader
-    data_loader = OrganizedDataLoader()
+    inputs = _load_inputs(sim, market, solar)
+    return _simulate(inputs, battery, sim, windows, tariffs, solar)
 
-    # Load market data
-    df = data_loader.get_data(
+
+def _load_inputs(sim: SimulationConfig, market: MarketConfig,
+                 solar: SolarPVConfig) -> pd.DataFrame:
+    """
+    Simulation inputs that depend only on the period, market and solar profile.
+    
+    Returns a frame on the simulation index with the clipped, resampled price,
+    the aligned solar power and each interval's minute of day.
+    """
+    # Organized data loader, shared across runs
+    data_loader = _loader()
+
+    # Load market data - only the timestamps and the configured price column
+    timestamps, prices = data_loader.get_price_array(
         region=market.region,
         start_date=sim.start,
         end_date=sim.end,
+        price_column=market.price_column,
     )
 
-    if df.empty:
+    if len(prices) == 0:
         raise ValueError(f"No organized data available for {market.region} in the specified period")
 
-    # Ensure we have the price column
-    if market.price_column not in df.columns:
-        raise ValueError(f"Price column '{market.price_column}' not found in organized data")
-
-    # Use the price column as specified
-    df["price"] = df[market.price_column]
+    # Apply price floor and ceiling (np.clip rejects two None bounds before numpy 2.1)
+    if market.price_floor is not None or market.price_ceiling is not None:
+        prices = np.clip(prices, market.price_floor, market.price_ceiling)
+    df = pd.DataFrame({"price": prices}, index=pd.DatetimeIndex(timestamps))
 
-    # Apply price floor and ceiling
-    df["price"] = df["price"].clip(lower=market.price_floor, upper=market.price_ceiling)
-
-    # Resample to simulation resolution
+    # Resample to simulation resolution - the index is sorted, so grouping on
+    # the floored timestamps gives the bins in order without a resampler.
+    # Bins with no data are left out, as gaps are at 5-minute resolution
     if sim.resolution_min != 5:
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        df_numeric = df[numeric_cols].resample(f"{sim.resolution_min}min").mean()
-        df = df_numeric
+        df = df.groupby(df.index.floor(f"{sim.resolution_min}min"), sort=False).mean()
 
     # Load solar profile if enabled
     if solar.enabled:
-        solar_profile = load_solar_profile(solar.production_profile, sim.start, sim.end)
-        # Scale solar profile to the configured capacity
-        solar_profile['solar_power_mw'] = solar_profile['solar_power_mw'] * (solar.capacity_mw / 5.2)
+        # Hourly profile on pd.date_range(sim.start, sim.end, freq='h'), scaled to the configured capacity
+        solar_hourly = _solar_profile_values(solar.production_profile, sim.start, sim.end) * (solar.capacity_mw / 5.2)
         
-        # Align solar profile with market data - ensure both have datetime index
-        if not isinstance(solar_profile.index, pd.DatetimeIndex):
-            solar_profile.index = pd.to_datetime(solar_profile.index)
-        if not isinstance(df.index, pd.DatetimeIndex):
-            df.index = pd.to_datetime(df.index)
-            
-        # Reindex solar profile to match market data frequency
-        solar_profile = solar_profile.reindex(df.index, method='ffill')
-        df['solar_power_mw'] = solar_profile['solar_power_mw'].fillna(0)
+        # The profile index is regular, so each interval's hour is an integer
+        # offset from the start - equivalent to a forward-filling reindex
+        hour_ns = pd.Timedelta(hours=1).value
+        offset = (df.index.asi8 - pd.Timestamp(sim.start).value) // hour_ns
+        in_range = offset >= 0
+        offset = np.clip(offset, 0, len(solar_hourly) - 1)
+        df['solar_power_mw'] = np.where(in_range, solar_hourly[offset], 0.0)
     else:
         df['solar_power_mw'] = 0
 
-    # Initialize simulation variables
-    soc = battery.soc_init_mwh
-    intervals = []
+    # Time of day of each interval, for the dispatch and demand window masks
+    df['minute_of_day'] = (df.index.hour * 60 + df.index.minute).to_numpy()
+    return df
 
-    # Hybrid dispatch logic
-    for timestamp, row in df.iterrows():
-        price = row["price"]
-        solar_power = row["solar_power_mw"]
-        
-        # Determine if we should charge or discharge based on time windows
-        should_charge = _is_in_window(timestamp, windows.charge_window[0], windows.charge_window[1])
-        should_discharge = _is_in_window(timestamp, windows.discharge_window[0], windows.discharge_window[1])
-        
-        # Calculate power dispatch
-        p_charge = 0.0
-        p_discharge = 0.0
-        p_solar_charge = 0.0
-        p_solar_export = 0.0
-        p_grid_charge = 0.0
-        
-        # Solar generation logic
-        if solar.enabled and solar_power > 0:
-            # First priority: Use solar to charge battery if in charge window and battery not full
-            if should_charge and soc < battery.soc_max_mwh:
-                # Calculate how much solar power can be used for charging
-                available_charge_capacity = min(
-                    battery.power_mw,  # Battery power limit
-                    (battery.soc_max_mwh - soc) / (sim.resolution_min / 60),  # SOC limit
-                    solar_power  # Available solar power
-                )
-                p_solar_charge = available_charge_capacity
-                # Apply solar efficiency to SOC update (energy stored in battery)
-                soc += p_solar_charge * (sim.resolution_min / 60) * solar.efficiency
-            
-            # Second priority: Export excess solar to grid
-            remaining_solar = solar_power - p_solar_charge
-            if remaining_solar > 0:
-                p_solar_export = remaining_solar * solar.export_efficiency
-        
-        # Grid charging logic (only if bidirectional enabled)
-        if should_charge and soc < battery.soc_max_mwh and (not solar.enabled or solar.bidirectional_charging):
-            # Calculate remaining charge capacity
-            available_charge_capacity = min(
-                battery.power_mw,
-                (battery.soc_max_mwh - soc) / (sim.resolution_min / 60)
-            )
-            p_grid_charge = available_charge_capacity
-            # Apply battery efficiency to SOC update (energy stored in battery)
-            soc += p_grid_charge * (sim.resolution_min / 60) * battery.eta_charge
-        
-        # Discharge logic
-        if should_discharge and soc > battery.soc_min_mwh:
-            # Calculate discharge capacity - account for efficiency losses
-            available_energy_mwh = soc - battery.soc_min_mwh
-            # Energy delivered to grid = available energy * discharge efficiency
-            max_discharge_energy = available_energy_mwh * battery.eta_discharge
-            max_discharge_power = max_discharge_energy / (sim.resolution_min / 60)
-            p_discharge = min(battery.power_mw, max_discharge_power)
-            # SOC decreases by the energy removed from battery (before efficiency)
-            soc -= p_discharge * (sim.resolution_min / 60) / battery.eta_discharge
-        
-        # Ensure SOC stays within bounds
-        soc = max(battery.soc_min_mwh, min(battery.soc_max_mwh, soc))
-        
-        # Calculate total charging power
-        p_charge = p_solar_charge + p_grid_charge
-        
-        # Calculate energy flows - account for efficiency properly
-        # Energy consumed from grid (for grid charging only)
-        energy_grid_charge = p_grid_charge * (sim.resolution_min / 60)
-        # Energy consumed from solar (for solar charging)
-        energy_solar_charge = p_solar_charge * (sim.resolution_min / 60)
-        # Total energy consumed (for revenue calculations)
-        energy_charge = energy_grid_charge + energy_solar_charge
-        # Energy delivered to grid from battery (after discharge efficiency)
-        energy_discharge = p_discharge * (sim.resolution_min / 60)
-        # Energy delivered to grid from solar export
-        energy_solar_export = p_solar_export * (sim.resolution_min / 60)
-        
-        # Store actual energy flows for proper efficiency calculation
-        # Energy stored in battery (after charging efficiency losses)
-        energy_stored = (p_solar_charge * solar.efficiency + p_grid_charge * battery.eta_charge) * (sim.resolution_min / 60)
-        # Energy removed from battery (before discharge efficiency losses)
-        energy_removed = p_discharge * (sim.resolution_min / 60) / battery.eta_discharge
-        
-        # Calculate revenue and costs
-        energy_revenue = (energy_discharge + energy_solar_export) * price
-        energy_cost = p_grid_charge * (sim.resolution_min / 60) * price
-        
-        # Network charges (simplified)
-        interval_duration_hours = sim.resolution_min / 60
-        
-        # Volumetric charges
-        cogs_network_volumetric = (p_grid_charge * (sim.resolution_min / 60) * tariffs.volume.import_aud_per_mwh) + \
-                                ((energy_discharge + energy_solar_export) * tariffs.volume.export_aud_per_mwh)
-        
-        # Demand charges (simplified)
-        cogs_network_demand = 0.0
-        if tariffs.demand and _is_in_window(timestamp, tariffs.demand.window[0], tariffs.demand.window[1]):
-            cogs_network_demand = max(p_charge, p_discharge) * tariffs.demand.rate_aud_per_kw * interval_duration_hours
-
-        intervals.append({
-            "timestamp": timestamp,
-            "price": price,
-            "solar_power_mw": solar_power,
-            "p_charge_mw": p_charge,
-            "p_discharge_mw": p_discharge,
-            "p_solar_charge_mw": p_solar_charge,
-            "p_solar_export_mw": p_solar_export,
-            "p_grid_charge_mw": p_grid_charge,
-            "soc_mwh": soc,
-            "energy_charge_mwh": energy_charge,
-            "energy_discharge_mwh": energy_discharge,
-            "energy_solar_export_mwh": energy_solar_export,
-            "energy_revenue_aud": energy_revenue,
-            "energy_cost_aud": energy_cost,
-            "network_cost_aud": cogs_network_volumetric + cogs_network_demand,
-        })
-
-    intervals_df = pd.DataFrame(intervals).set_index("timestamp")
-
-    # Calculate summary metrics
-    total_charge = intervals_df["energy_charge_mwh"].sum()
-    total_discharge = intervals_df["energy_discharge_mwh"].sum()
-    total_solar_export = intervals_df["energy_solar_export_mwh"].sum()
-    total_revenue = intervals_df["energy_revenue_aud"].sum()
-    total_cost = intervals_df["energy_cost_aud"].sum()
-    total_network_cost = intervals_df["network_cost_aud"].sum()
+
+def _simulate(
+    df: pd.DataFrame,
+    battery: BatteryConfig,
+    sim: SimulationConfig,
+    windows: DispatchWindowsConfig,
+    tariffs: NetworkTariffsConfig,
+    solar: SolarPVConfig,
+) -> Dict[str, Any]:
+    """Dispatch the battery over prepared inputs from _load_inputs and summarize."""
+    # Extract inputs as arrays; time windows become boolean masks over the index
+    dt_h = sim.resolution_min / 60
+    n_intervals = len(df)
+    price = df["price"].to_numpy(dtype=np.float64)
+    solar_power = df["solar_power_mw"].to_numpy(dtype=np.float64)
+    minute_of_day = df["minute_of_day"].to_numpy()
+    charge_mask = _window_mask(minute_of_day, windows.charge_window)
+    discharge_mask = _window_mask(minute_of_day, windows.discharge_window)
+
+    # Grid charging is allowed for BESS-only runs, or hybrid runs with bidirectional charging
+    grid_charging = not solar.enabled or solar.bidirectional_charging
+
+    # Hybrid dispatch logic - SOC is sequential, so only this part steps per interval
+    soc_mwh, p_solar_charge, p_grid_charge, p_discharge = _dispatch_loop(
+        solar_power,
+        charge_mask,
+        discharge_mask,
+        float(battery.soc_init_mwh),
+        float(battery.soc_min_mwh),
+        float(battery.soc_max_mwh),
+        float(battery.power_mw),
+        float(battery.eta_charge),
+        float(battery.eta_discharge),
+        float(solar.efficiency),
+        float(dt_h),
+        bool(solar.enabled),
+        bool(grid_charging),
+    )
+    soc = float(soc_mwh[-1])
+
+    # Second priority for solar: export whatever was not used for charging
+    if solar.enabled:
+        p_solar_export = np.maximum(solar_power - p_solar_charge, 0.0) * solar.export_efficiency
+    else:
+        p_solar_export = np.zeros(n_intervals)
+
+    # Energy flows - grid and solar charging consumed, battery and solar delivered
+    p_charge = p_solar_charge + p_grid_charge
+    energy_grid_charge = p_grid_charge * dt_h
+    energy_charge = energy_grid_charge + p_solar_charge * dt_h
+    energy_discharge = p_discharge * dt_h
+    energy_solar_export = p_solar_export * dt_h
+    energy_delivered = energy_discharge + energy_solar_export
+
+    # Revenue, energy cost and volumetric network charges
+    energy_revenue = energy_delivered * price
+    energy_cost = energy_grid_charge * price
+    network_cost = (energy_grid_charge * tariffs.volume.import_aud_per_mwh) + \
+                   (energy_delivered * tariffs.volume.export_aud_per_mwh)
+
+    # Demand charges (simplified)
+    if tariffs.demand:
+        demand_mask = _window_mask(minute_of_day, tariffs.demand.window)
+        network_cost += np.where(
+            demand_mask,
+            np.maximum(p_charge, p_discharge) * tariffs.demand.rate_aud_per_kw * dt_h,
+            0.0,
+        )
+
+    # Interval results are stored as float32 to halve memory for downstream
+    # analysis; summary totals below are accumulated in float64. SOC is the
+    # exception (inserted below) and keeps the kernel's float64 values
+    columns = {
+        "price": price,
+        "solar_power_mw": solar_power,
+        "p_charge_mw": p_charge,
+        "p_discharge_mw": p_discharge,
+        "p_solar_charge_mw": p_solar_charge,
+        "p_solar_export_mw": p_solar_export,
+        "p_grid_charge_mw": p_grid_charge,
+        "energy_charge_mwh": energy_charge,
+        "energy_discharge_mwh": energy_discharge,
+        "energy_solar_export_mwh": energy_solar_export,
+        "energy_revenue_aud": energy_revenue,
+        "energy_cost_aud": energy_cost,
+        "network_cost_aud": network_cost,
+    }
+    # Down-cast straight into one (columns x intervals) float32 block, which is
+    # pandas' own layout, so the frame wraps it without a consolidation copy
+    block = np.empty((len(columns), n_intervals), dtype=np.float32)
+    for row, values in zip(block, columns.values()):
+        row[:] = values
+    intervals_df = pd.DataFrame(
+        block.T,
+        columns=list(columns),
+        index=pd.DatetimeIndex(df.index, name="timestamp"),
+        copy=False,
+    )
+    intervals_df.insert(intervals_df.columns.get_loc("p_grid_charge_mw") + 1, "soc_mwh", soc_mwh)
+    columns = dict(zip(columns, block))
+
+    # Calculate summary metrics - every column total in one reduction over the block
+    totals = dict(zip(columns, block.sum(axis=1, dtype=np.float64)))
+    total_charge = totals["energy_charge_mwh"]
+    total_discharge = totals["energy_discharge_mwh"]
+    total_solar_export = totals["energy_solar_export_mwh"]
+    total_revenue = totals["energy_revenue_aud"]
+    total_cost = totals["energy_cost_aud"]
+    total_network_cost = totals["network_cost_aud"]
     
     # Calculate actual round trip efficiency based on energy flows
     # Total energy consumed from sources (grid + solar)
@@ -282,15 +314,20 @@ def run_simulation_hybrid(
     else:
         round_trip_efficiency = 0.0
     
-    # Price metrics
-    charge_prices = intervals_df[intervals_df["p_charge_mw"] > 0]["price"]
-    discharge_prices = intervals_df[intervals_df["p_discharge_mw"] > 0]["price"]
-    solar_export_prices = intervals_df[intervals_df["p_solar_export_mw"] > 0]["price"]
-    
-    avg_import_price = charge_prices.mean() if not charge_prices.empty else 0.0
-    avg_export_price = discharge_prices.mean() if not discharge_prices.empty else 0.0
-    avg_solar_export_price = solar_export_prices.mean() if not solar_export_prices.empty else 0.0
-    avg_price = intervals_df["price"].mean()
+    # Price metrics - average price over the charging, discharging and solar
+    # export intervals, as one matrix-vector product with the activity masks
+    active = np.stack([
+        columns["p_charge_mw"] > 0,
+        columns["p_discharge_mw"] > 0,
+        columns["p_solar_export_mw"] > 0,
+    ]).astype(np.float64)
+    active_counts = active.sum(axis=1)
+    active_price_sums = active @ columns["price"].astype(np.float64)
+    avg_import_price, avg_export_price, avg_solar_export_price = (
+        price_sum / count if count else 0.0
+        for price_sum, count in zip(active_price_sums, active_counts)
+    )
+    avg_price = totals["price"] / n_intervals
 
     # Fixed charges
     if tariffs.fixed.cadence == 'yearly':
@@ -338,3 +375,67 @@ def run_simulation_hybrid(
     }
 
     return {"intervals": intervals_df, "summary": summary}
+
+
+def _run_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point: run one simulation from a keyword-argument dict."""
+    return run_simulation_hybrid(**config)
+
+
+def run_sweep(configs: Iterable[Dict[str, Any]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run independent simulations in parallel, one process per CPU by default.
+    
+    Args:
+        configs: Keyword-argument dicts for run_simulation_hybrid (battery, sim,
+            market, windows, tariffs, solar)
+        max_workers: Number of worker processes (default: CPU count)
+        
+    Returns:
+        List of simulation results, in the same order as configs
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_config, configs))
+
+
+def run_simulations_batch(configs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Run simulations in this process, preparing shared inputs once per group.
+    
+    Configs are grouped by everything the inputs depend on (period and
+    resolution, market including price bounds, and solar profile and
+    capacity). Each group loads, clips and resamples its prices and aligns its
+    solar profile once; only the dispatch and summary run per config. Use
+    run_sweep instead to spread independent runs over several processes.
+    
+    Args:
+        configs: Keyword-argument dicts for run_simulation_hybrid (battery, sim,
+            market, windows, tariffs, solar)
+        
+    Returns:
+        List of simulation results, in the same order as configs
+    """
+    configs = list(configs)
+    groups: Dict[tuple, List[int]] = {}
+    for i, config in enumerate(configs):
+        solar = config["solar"]
+        solar_key = (solar.production_profile, solar.capacity_mw) if solar.enabled else None
+        key = (config["sim"], config["market"], solar.enabled, solar_key)
+        groups.setdefault(key, []).append(i)
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(configs)
+    for indices in groups.values():
+        first = configs[indices[0]]
+        inputs = _load_inputs(first["sim"], first["market"], first["solar"])
+        for i in indices:
+            config = configs[i]
+            results[i] = _simulate(
+                inputs,
+                config["battery"],
+                config["sim"],
+                config["windows"],
+                config["tariffs"],
+                config["solar"],
+            )
+    return results
+
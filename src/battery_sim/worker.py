@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Tuple
+import pandas as pd
+import pyarrow as pa
+
+from .config import (
+    BatteryConfig,
+    SimulationConfig,
+    MarketConfig,
+    DispatchWindowsConfig,
+    NetworkTariffsConfig,
+    SolarPVConfig,
+)
+from .sim_hybrid import run_simulation_hybrid
+
+
+def run_simulation_to_ipc(
+    battery: BatteryConfig,
+    sim: SimulationConfig,
+    market: MarketConfig,
+    windows: DispatchWindowsConfig,
+    tariffs: NetworkTariffsConfig,
+    solar: SolarPVConfig,
+) -> Tuple[pa.Buffer, Dict[str, Any]]:
+    """
+    Run a hybrid simulation and return the intervals as an Arrow IPC stream.
+
+    Intended as a process-pool entry point: the Arrow stream crosses the
+    process boundary as one contiguous buffer instead of a pickled DataFrame.
+    """
+    results = run_simulation_hybrid(
+        battery=battery,
+        sim=sim,
+        market=market,
+        windows=windows,
+        tariffs=tariffs,
+        solar=solar,
+    )
+
+    table = pa.Table.from_pandas(results["intervals"], preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue(), results["summary"]
+
+
+def read_intervals_ipc(payload: pa.Buffer) -> pd.DataFrame:
+    """Rebuild the intervals DataFrame from an Arrow IPC stream."""
+    return pa.ipc.open_stream(payload).read_all().to_pandas()
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from organized_data_loader import MEMORY_MAP, PARQUET_ENGINE, USE_THREADS
+
 
 class DataFormat(Enum):
     """Supported data formats for storage and retrieval."""
@@ -169,11 +171,12 @@ FILE_PATTERNS = {
 
 # Performance Settings
 PERFORMANCE_CONFIG = {
-    "parquet_engine": "pyarrow",  # pyarrow or fastparquet
+    # Parquet settings are defined by the loader that applies them
+    "parquet_engine": PARQUET_ENGINE,  # pyarrow or fastparquet
     "csv_engine": "c",  # c or python
     "chunk_size": 100000,
-    "memory_map": True,
-    "use_threads": True
+    "memory_map": MEMORY_MAP,
+    "use_threads": USE_THREADS
 }
 
 # Logging Configuration
@@ -3,13 +3,108 @@
 Organized Data Loader - Loads data directly from the organized data folder
 """
 
+import functools
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Tuple, Union
 from datetime import datetime
 import logging
 
 
+# Parquet read settings; PERFORMANCE_CONFIG in src/config.py reads these (they
+# live here so importing the loader has no side effects)
+PARQUET_ENGINE = "pyarrow"
+MEMORY_MAP = True
+USE_THREADS = True
+
+# Repeated string columns in the organized RRP files, loaded as categoricals
+CATEGORICAL_COLUMNS = ["region", "REGIONID", "PRICE_STATUS"]
+
+
+def _source_mtime_ns(source: Path) -> int:
+    """Modification time of a parquet file, or of the newest part file in a dataset directory."""
+    if source.is_dir():
+        return max((part.stat().st_mtime_ns for part in source.rglob("*.parquet")), default=0)
+    return source.stat().st_mtime_ns
+
+
+@functools.lru_cache(maxsize=8)
+def _read_price_array(source: Path, mtime_ns: int, start_date, end_date,
+                      price_column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read and cache one price series; the returned arrays are read-only.
+    
+    ``source`` is either a single organized parquet file or a region directory
+    of the year-partitioned layout written by scripts/partition_rrp_data.py.
+    ``mtime_ns`` is only part of the cache key, so rewritten data is read
+    again instead of being served stale.
+    """
+    settlement = ds.field("SETTLEMENTDATE")
+    start_ts = pd.Timestamp(start_date)
+    end_ts = pd.Timestamp(end_date)
+    row_filter = (
+        (settlement >= pa.scalar(start_ts, type=pa.timestamp("ns")))
+        & (settlement <= pa.scalar(end_ts, type=pa.timestamp("ns")))
+    )
+    
+    if source.is_dir():
+        # Only the year=YYYY partitions in range are opened at all
+        dataset = ds.dataset(str(source), format="parquet", partitioning="hive")
+        year = ds.field("year")
+        row_filter = row_filter & (year >= start_ts.year) & (year <= end_ts.year)
+    else:
+        dataset = ds.dataset(str(source), format="parquet")
+    
+    if price_column not in dataset.schema.names:
+        raise ValueError(f"Price column '{price_column}' not found in organized data")
+    
+    table = dataset.to_table(
+        columns=["SETTLEMENTDATE", price_column],
+        filter=row_filter,
+        use_threads=USE_THREADS,
+    )
+    if source.is_dir():
+        # Partitions are scanned as separate files; restore time order (stable,
+        # so duplicate settlement intervals keep their original order)
+        table = table.sort_by("SETTLEMENTDATE")
+    table = table.combine_chunks()
+    
+    # Cached arrays are shared between callers, so they must never be written
+    timestamps = table.column("SETTLEMENTDATE").to_numpy()
+    prices = table.column(price_column).cast(pa.float32()).to_numpy()
+    timestamps.setflags(write=False)
+    prices.setflags(write=False)
+    return timestamps, prices
+
+
+@functools.lru_cache(maxsize=4)
+def _read_organized_file(file_path: Path, mtime_ns: int, start_date: pd.Timestamp,
+                         end_date: pd.Timestamp,
+                         columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """
+    Read and cache one date range of an organized parquet file.
+    
+    ``mtime_ns`` is only part of the cache key, so a rewritten file is read
+    again instead of being served stale.
+    """
+    # The date range is pushed down to the parquet scan, so row groups outside
+    # it are skipped by their statistics; low-cardinality string columns are
+    # decoded straight from their parquet dictionaries into categoricals
+    return pd.read_parquet(
+        file_path,
+        engine=PARQUET_ENGINE,
+        columns=list(columns) if columns is not None else None,
+        filters=[("SETTLEMENTDATE", ">=", start_date), ("SETTLEMENTDATE", "<=", end_date)],
+        read_dictionary=CATEGORICAL_COLUMNS,
+        memory_map=MEMORY_MAP,
+        use_threads=USE_THREADS,
+    )
+
+
 class OrganizedDataLoader:
     """Loads data directly from the organized data folder."""
     
@@ -22,7 +117,8 @@ class OrganizedDataLoader:
             raise FileNotFoundError(f"Organized data path not found: {self.organized_data_path}")
     
     def get_data(self, region: str, start_date: Union[str, datetime], 
-                end_date: Union[str, datetime]) -> pd.DataFrame:
+                end_date: Union[str, datetime],
+                columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Get organized data for a specific region and date range.
         
@@ -30,6 +126,8 @@ class OrganizedDataLoader:
             region: NEM region code (NSW1, QLD1, VIC1, SA1)
             start_date: Start date (string or datetime)
             end_date: End date (string or datetime)
+            columns: Columns to read (default: all); the timestamp index is
+                always included
             
         Returns:
             DataFrame with organized data
@@ -46,12 +144,16 @@ class OrganizedDataLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"Organized data file not found: {file_path}")
         
-        # Load data
+        # Load only the date range - repeated calls reuse the cached read, and
+        # callers get a copy so the cached frame is never modified
         self.logger.info(f"Loading organized data from {file_path}")
-        df = pd.read_parquet(file_path)
-        
-        # Filter by date range
-        df = df[(df.index >= start_date) & (df.index <= end_date)]
+        df = _read_organized_file(
+            file_path,
+            file_path.stat().st_mtime_ns,
+            start_date,
+            end_date,
+            tuple(columns) if columns is not None else None,
+        ).copy()
         
         if df.empty:
             self.logger.warning(f"No data found for {region} in date range {start_date} to {end_date}")
@@ -60,6 +162,44 @@ class OrganizedDataLoader:
         self.logger.info(f"Loaded {len(df):,} rows for {region} from {start_date} to {end_date}")
         return df
     
+    def get_price_array(self, region: str, start_date: Union[str, datetime],
+                        end_date: Union[str, datetime],
+                        price_column: str = "price_aud_per_mwh") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get settlement timestamps and prices as NumPy arrays, without a DataFrame.
+        
+        Only the timestamp and price columns are decoded, and the date range is
+        pushed down to the parquet scan. If the year-partitioned layout from
+        scripts/partition_rrp_data.py exists, only the years in range are read.
+        Results are cached per source, date range and column, so repeated runs
+        skip the read; the arrays are read-only.
+        
+        Args:
+            region: NEM region code (NSW1, QLD1, VIC1, SA1)
+            start_date: Start date (string or datetime)
+            end_date: End date (string or datetime)
+            price_column: Price column to read
+            
+        Returns:
+            Tuple of (datetime64[ns] timestamps, float32 prices)
+        """
+        source = self.organized_data_path / "rrp" / f"region={region}"
+        if not source.exists():
+            source = self.organized_data_path / f"{region}_rrp_2020_2025.parquet"
+        
+        if not source.exists():
+            raise FileNotFoundError(f"Organized data file not found: {source}")
+        
+        self.logger.info(f"Loading {price_column} from {source}")
+        timestamps, prices = _read_price_array(
+            source, _source_mtime_ns(source), start_date, end_date, price_column
+        )
+        
+        if len(prices) == 0:
+            self.logger.warning(f"No data found for {region} in date range {start_date} to {end_date}")
+        
+        return timestamps, prices
+    
     def get_available_regions(self) -> list:
         """Get list of available regions in organized data."""
         parquet_files = list(self.organized_data_path.glob("*_rrp_2020_2025.parquet"))
@@ -74,9 +214,18 @@ class OrganizedDataLoader:
             file_path = self.organized_data_path / f"{region}_rrp_2020_2025.parquet"
             
             if file_path.exists():
-                df = pd.read_parquet(file_path)
+                # Row count comes from the parquet footer; only the price
+                # column (plus the timestamp index) is actually decoded
+                metadata = pq.ParquetFile(file_path).metadata
+                df = pd.read_parquet(
+                    file_path,
+                    engine=PARQUET_ENGINE,
+                    columns=["price_aud_per_mwh"],
+                    memory_map=MEMORY_MAP,
+                    use_threads=USE_THREADS,
+                )
                 summary[region] = {
-                    "rows": len(df),
+                    "rows": metadata.num_rows,
                     "size_mb": file_path.stat().st_size / (1024 * 1024),
                     "date_range": f"{df.index.min()} to {df.index.max()}",
                     "years": sorted(df.index.year.unique()),
@@ -102,3 +251,20 @@ def load_organized_data(region: str, start_date: Union[str, datetime],
     """
     loader = OrganizedDataLoader()
     return loader.get_data(region, start_date, end_date)
+
+
+def load_rrp_array(region: str, start_date: Union[str, datetime],
+                   end_date: Union[str, datetime]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convenience function to load RRP timestamps and prices as NumPy arrays.
+    
+    Args:
+        region: NEM region code (NSW1, QLD1, VIC1, SA1)
+        start_date: Start date (string or datetime)
+        end_date: End date (string or datetime)
+        
+    Returns:
+        Tuple of (datetime64[ns] timestamps, float32 prices)
+    """
+    loader = OrganizedDataLoader()
+    return loader.get_price_array(region, start_date, end_date)
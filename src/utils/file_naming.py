@@ -3,12 +3,18 @@
 Utility functions for file naming with timestamps and version numbers
 """
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import functools
 import os
+import re
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
 
 
-def generate_timestamped_filename(base_name: str, extension: str, version: int = 1) -> str:
+def generate_timestamped_filename(base_name: str, extension: str, version: int = 1,
+                                  timestamp: str = None) -> str:
     """
     Generate a filename with timestamp and version number.
     
@@ -16,6 +22,7 @@ def generate_timestamped_filename(base_name: str, extension: str, version: int =
         base_name: Base name for the file (without extension)
         extension: File extension (e.g., 'xlsx', 'csv', 'pdf')
         version: Version number (default: 1)
+        timestamp: Timestamp string in YYYYMMDD_HHMMSS format (default: now)
     
     Returns:
         Formatted filename: base_name_YYYYMMDD_HHMMSS_vX.extension
@@ -24,10 +31,83 @@ def generate_timestamped_filename(base_name: str, extension: str, version: int =
         >>> generate_timestamped_filename("battery_simulation", "xlsx", 1)
         "battery_simulation_20241220_143022_v1.xlsx"
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
     return f"{base_name}_{timestamp}_v{version}.{extension}"
 
 
+# Output directories (absolute paths) already created by ensure_output_directory
+# in this process
+_created_dirs = set()
+
+# Directories that did not exist before this process created them, so they hold
+# no earlier versions and never need scanning
+_new_dirs = set()
+
+# Last version issued per (directory, base_name, extension); only the first
+# request for a key scans the directory, later ones count on from here
+_issued_versions = {}
+
+# Guards _created_dirs, _new_dirs and _issued_versions
+_state_lock = threading.Lock()
+
+# Working directory at the first create_timestamped_file call without a directory
+_default_dir = None
+
+
+@functools.lru_cache(maxsize=None)
+def _version_pattern(base_name: str, extension: str) -> re.Pattern:
+    """Compiled bytes regex matching base_name_*_vX.extension, capturing X."""
+    base_name = re.escape(os.fsencode(base_name))
+    extension = re.escape(os.fsencode(extension))
+    return re.compile(base_name + rb"_.*_v(\d+)\." + extension + rb"\Z")
+
+
+def _last_issued_version(key: Tuple[str, str, str], directory: Path,
+                         base_name: str, extension: str) -> int:
+    """Last version issued for key, seeded from the directory on first use (hold _state_lock)."""
+    version = _issued_versions.get(key)
+    if version is None:
+        if key[0] in _new_dirs:
+            version = 0
+        else:
+            version = get_next_version_number(directory, base_name, extension) - 1
+    return version
+
+
+def _scan_versions(directory: Path, base_name: str,
+                   extension: str) -> Tuple[int, Optional[os.DirEntry]]:
+    """Highest existing version of base_name_*_vX.extension and its directory entry."""
+    # A missing directory is found by the scan itself, without a separate stat.
+    # Scanning a bytes path yields bytes names, skipping the decode per entry
+    try:
+        entries = os.scandir(os.fsencode(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0, None
+    
+    # Look for existing files with the same base name and extension
+    # Format: base_name_YYYYMMDD_HHMMSS_vX.extension
+    pattern = _version_pattern(base_name, extension)
+    prefix = os.fsencode(f"{base_name}_")
+    suffix = os.fsencode(f".{extension}")
+    max_version = 0
+    latest = None
+    with entries:
+        for entry in entries:
+            # Cheap prefix/suffix checks first; only candidates go through the regex
+            name = entry.name
+            if not (name.startswith(prefix) and name.endswith(suffix)):
+                continue
+            match = pattern.match(name)
+            if match:
+                version = int(match.group(1))
+                if latest is None or version > max_version:
+                    max_version = version
+                    latest = entry
+    
+    return max_version, latest
+
+
 def get_next_version_number(directory: Path, base_name: str, extension: str) -> int:
     """
     Get the next version number for a file in a directory.
@@ -40,64 +120,169 @@ def get_next_version_number(directory: Path, base_name: str, extension: str) ->
     Returns:
         Next version number to use
     """
-    if not directory.exists():
-        return 1
+    max_version, _ = _scan_versions(directory, base_name, extension)
+    return max_version + 1
+
+
+def get_next_version_numbers(requests: Iterable[Tuple[Path, str, str]]) -> List[int]:
+    """
+    Get next version numbers for many (directory, base_name, extension) requests.
     
-    # Look for existing files with the same base name and extension
-    pattern = f"{base_name}_*_v*.{extension}"
-    existing_files = list(directory.glob(pattern))
+    The directory scans run concurrently in a thread pool; os.scandir releases
+    the GIL while reading, so scans of separate directories overlap.
+    Like get_next_version_number this only scans: it reserves nothing and does
+    not see versions handed out by create_timestamped_file whose files have not
+    been written yet. Use open_next_versioned_file to claim a version.
     
-    if not existing_files:
-        return 1
+    Args:
+        requests: (directory, base_name, extension) tuples, as for
+            get_next_version_number
     
-    # Extract version numbers from existing files
-    versions = []
-    for file in existing_files:
-        try:
-            # Extract version number from filename
-            # Format: base_name_YYYYMMDD_HHMMSS_vX.extension
-            parts = file.stem.split('_')
-            if len(parts) >= 3 and parts[-1].startswith('v'):
-                version = int(parts[-1][1:])  # Remove 'v' prefix
-                versions.append(version)
-        except (ValueError, IndexError):
-            continue
+    Returns:
+        Next version numbers, in the same order as requests
+    """
+    requests = list(requests)
+    if not requests:
+        return []
     
-    return max(versions) + 1 if versions else 1
+    with ThreadPoolExecutor(max_workers=min(32, len(requests))) as executor:
+        return list(executor.map(get_next_version_number, *zip(*requests)))
 
 
-def create_timestamped_file(base_name: str, extension: str, directory: Path = None, version: int = None) -> Path:
+def get_latest_version_entry(directory: Path, base_name: str, extension: str) -> Optional[os.DirEntry]:
+    """
+    Get the directory entry of the highest existing version of a file.
+    
+    The entry comes from os.scandir, so callers filtering on size or mtime can
+    use entry.stat(), which is cached on the entry, instead of a separate stat.
+    Entry names and paths are bytes; use os.fsdecode() for a str.
+    
+    Args:
+        directory: Directory to search for existing files
+        base_name: Base name to search for
+        extension: File extension to search for
+    
+    Returns:
+        os.DirEntry of the latest version, or None if there is none
+    """
+    _, latest = _scan_versions(directory, base_name, extension)
+    return latest
+
+
+def create_timestamped_file(base_name: str, extension: str, directory: Path = None, version: int = None,
+                            timestamp: str = None) -> Path:
     """
     Create a timestamped file path with automatic version numbering.
     
     Args:
         base_name: Base name for the file
         extension: File extension
-        directory: Directory to save the file (default: current directory)
-        version: Specific version number (if None, auto-increment)
+        directory: Directory to save the file (default: the working directory
+            at the first such call; pass Path.cwd() explicitly if it changes)
+        version: Specific version number (if None, auto-increment: the
+            directory is scanned on the first call per base name and
+            extension, and later calls count on from the last version issued,
+            skipping past any name that already exists on disk)
+        timestamp: Timestamp string to use, so related files can share one
+            (if None, the current time)
     
     Returns:
         Path object for the new file
     """
+    global _default_dir
     if directory is None:
-        directory = Path.cwd()
+        if _default_dir is None:
+            _default_dir = Path.cwd()
+        directory = _default_dir
     
-    if version is None:
-        version = get_next_version_number(directory, base_name, extension)
+    if version is not None:
+        # Join as strings and build the Path once, rather than through Path.__truediv__
+        filename = generate_timestamped_filename(base_name, extension, version, timestamp)
+        return Path(os.path.join(os.fspath(directory), filename))
     
-    filename = generate_timestamped_filename(base_name, extension, version)
-    return directory / filename
+    if timestamp is None:
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+    key = (os.path.abspath(directory), base_name, extension)
+    with _state_lock:
+        version = _last_issued_version(key, directory, base_name, extension)
+        while True:
+            # The counter only knows this process's names; another writer may
+            # have created the next one since, so never hand out an existing path
+            version += 1
+            filename = generate_timestamped_filename(base_name, extension, version, timestamp)
+            path = os.path.join(os.fspath(directory), filename)
+            if not os.path.lexists(path):
+                break
+        _issued_versions[key] = version
+    return Path(path)
+
+
+def open_next_versioned_file(base_name: str, extension: str, directory: Path,
+                             timestamp: str = None) -> Tuple[int, Path]:
+    """
+    Create the next timestamped, versioned file and open it for writing.
+    
+    The file is created with O_CREAT | O_EXCL, so two writers can never be
+    handed the same name: on a clash the version is bumped and the create
+    retried. The directory is scanned for existing versions only on the first
+    call per base name and extension; later calls continue from the last
+    version issued.
+    
+    Args:
+        base_name: Base name for the file
+        extension: File extension
+        directory: Directory to create the file in
+        timestamp: Timestamp string to use (if None, the current time)
+    
+    Returns:
+        Tuple of (OS-level file descriptor opened for writing, file path)
+    """
+    key = (os.path.abspath(directory), base_name, extension)
+    with _state_lock:
+        version = _last_issued_version(key, directory, base_name, extension)
+        while True:
+            version += 1
+            filename = generate_timestamped_filename(base_name, extension, version, timestamp)
+            path = os.path.join(os.fspath(directory), filename)
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                continue
+            _issued_versions[key] = version
+            return fd, Path(path)
 
 
 def ensure_output_directory(base_path: Path) -> Path:
     """
     Ensure the output directory exists and create it if necessary.
     
+    Once a directory has been created, later calls only check that it still
+    exists instead of issuing mkdir for every parent; a directory removed in
+    between is created again.
+    Files named by create_timestamped_file in a directory created here are
+    versioned from an in-process counter instead of a directory scan.
+    
     Args:
         base_path: Base path for the output directory
     
     Returns:
         Path object for the output directory
     """
-    base_path.mkdir(parents=True, exist_ok=True)
+    key = os.path.abspath(base_path)
+    if key in _created_dirs and os.path.isdir(key):
+        return base_path
+    
+    with _state_lock:
+        try:
+            base_path.mkdir(parents=True)
+        except FileExistsError:
+            if not base_path.is_dir():
+                raise
+        else:
+            # Created just now, so it holds no versions; forget any counters
+            # left from an earlier directory at the same path
+            _new_dirs.add(key)
+            for stale in [k for k in _issued_versions if k[0] == key]:
+                del _issued_versions[stale]
+        _created_dirs.add(key)
     return base_path